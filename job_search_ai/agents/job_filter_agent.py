@@ -53,32 +53,33 @@ class JobFilterAgent:
             medium_path=str(base_path / profile_paths.get('medium_profile'))
         )
         
-        # Parse all profile data sources
+        # Parse all profile data sources concurrently
         print("\nAnalyzing Profile Data...")
+        parsed = self.profile_parser.parse_all()
         
         print("\n1. Analyzing CV...")
-        self.cv_data = self.profile_parser.parse_cv()
+        self.cv_data = parsed['cv']
         if self.cv_data:
             print("Skills found:", self.cv_data.get('skills', []))
             print("Experiences found:", self.cv_data.get('experiences', []))
         
         print("\n2. Analyzing Skills...")
-        self.skills_data = self.profile_parser.parse_skills()
+        self.skills_data = parsed['skills']
         if self.skills_data:
             print("Technical Skills:", self.skills_data.get('technical', []))
             print("Soft Skills:", self.skills_data.get('soft', []))
         
         print("\n3. Analyzing LinkedIn Experience...")
-        self.linkedin_data = self.profile_parser.parse_linkedin_experience()
+        self.linkedin_data = parsed['linkedin_experience']
         if self.linkedin_data:
             print("Roles:", self.linkedin_data.get('roles', []))
             print("Companies:", self.linkedin_data.get('companies', []))
         
         print("\n4. Analyzing LinkedIn Posts...")
-        self.linkedin_posts_data = self.profile_parser.parse_linkedin_posts()
+        self.linkedin_posts_data = parsed['linkedin_posts']
         
         print("\n5. Analyzing Medium Profile...")
-        self.medium_data = self.profile_parser.parse_medium_profile()
+        self.medium_data = parsed['medium']
         if self.medium_data:
             print("Topics:", self.medium_data.get('topics', []))
             print("Expertise:", self.medium_data.get('expertise', []))
@@ -245,7 +245,7 @@ class JobFilter(BaseTool):
             """
             
             job_embedding = client.embeddings.create(
-                model="text-embedding-ada-002",
+                model="text-embedding-3-small",  # Same model as the profile embeddings
                 input=job_text[:8000]
             ).data[0].embedding
             
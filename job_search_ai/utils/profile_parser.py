@@ -5,11 +5,534 @@ from collections import Counter
 from pathlib import Path
 import traceback
 import csv
+import codecs
 import json
 from langchain_openai import OpenAI
 from typing import Dict, Any
 import pandas as pd
 import os
+import logging
+import hashlib
+import gzip
+import pickle
+import tempfile
+import shelve
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from itertools import chain, islice
+
+try:
+    # C-backed HTML5 parser; BeautifulSoup is used when it is not installed
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+try:
+    # lxml builds the BeautifulSoup tree in C; fall back to the stdlib parser
+    import lxml
+    BS4_PARSER = 'lxml'
+except ImportError:
+    BS4_PARSER = 'html.parser'
+
+try:
+    # MuPDF bindings, the fastest text extraction backend
+    import fitz
+except ImportError:
+    fitz = None
+
+try:
+    # Optional PDFium bindings (not pinned; PyMuPDF is the pinned native backend).
+    # pdfminer is used when neither native backend is installed
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+try:
+    # Statistical charset detection for CSV exports of unknown encoding
+    import charset_normalizer
+except ImportError:
+    charset_normalizer = None
+
+try:
+    # Multi-threaded C CSV reader for large LinkedIn exports
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
+
+logger = logging.getLogger(__name__)
+
+# On-disk caches (embeddings, parsed files) live here so re-runs are cheap.
+# They hold CV and LinkedIn data; set AIJOBSEARCH_CACHE_DIR to '' to turn them off
+CACHE_DIR = os.environ.get('AIJOBSEARCH_CACHE_DIR', Path.home() / '.cache' / 'aijobsearch')
+CACHE_DIR = Path(CACHE_DIR) if CACHE_DIR else None
+CACHE_VERSION = 1  # Bump when parsing changes so cached parse results are not reused
+
+EMBEDDING_MODEL = "text-embedding-3-small"  # Must match the model JobFilter embeds jobs with
+EMBEDDING_BATCH_SIZE = 128  # Inputs sent per embeddings API call
+EMBEDDING_CONCURRENCY = 4  # Batches in flight at once
+
+# Keywords used when analysing CV text
+CV_SKILLS = (
+    'Python', 'Java', 'AWS', 'Azure', 'Cloud', 'AI', 'ML', 
+    'DevOps', 'Agile', 'Project Management'
+)
+
+CV_ROLES = (
+    'Program Manager', 'Director', 'Engineer', 'Head', 'Lead',
+    'Architect', 'CTO', 'Technical Program Manager'
+)
+
+TECHNICAL_SKILLS = (
+    'Python', 'Java', 'AWS', 'Azure', 'Cloud', 'AI', 'ML',
+    'DevOps', 'Agile', 'Kubernetes', 'Docker', 'Microservices'
+)
+
+SOFT_SKILLS = (
+    'Leadership', 'Management', 'Communication', 'Strategy',
+    'Vision', 'Innovation', 'Problem Solving', 'Team Building'
+)
+
+ROLES = (
+    'Director', 'Manager', 'Lead', 'Head', 'Architect',
+    'CTO', 'Technical Program Manager', 'Program Director'
+)
+
+# Common tech and business topics
+TOPICS = {
+    'AI/ML': (
+        'AI', 'ML', 'Machine Learning', 'Artificial Intelligence', 'Deep Learning',
+        'Neural Networks', 'NLP', 'Computer Vision', 'Data Science',
+        'Generative AI', 'LLM', 'Large Language Models'
+    ),
+    'Cloud/Infrastructure': (
+        'Cloud', 'AWS', 'Azure', 'GCP', 'Kubernetes', 'Docker',
+        'Microservices', 'DevOps', 'Infrastructure'
+    ),
+    'Business/Strategy': (
+        'Leadership', 'Strategy', 'Innovation', 'Digital Transformation',
+        'Product Management', 'Agile', 'Business Development'
+    ),
+    'Industry': (
+        'Healthcare', 'Finance', 'Automotive', 'Retail', 'Manufacturing',
+        'Technology', 'Consulting'
+    ),
+    'Skills': (
+        'Project Management', 'Program Management', 'Team Leadership',
+        'Architecture', 'Security', 'Data Analytics'
+    )
+}
+
+EXPERTISE_AREAS = (
+    'Technology', 'Strategy', 'Architecture', 'Management',
+    'Digital Transformation', 'Innovation', 'Leadership'
+)
+
+POST_THEMES = (
+    'Digital Transformation', 'Cloud Computing', 'Leadership',
+    'Technology Strategy', 'Innovation', 'AI/ML',
+    'Project Management', 'Agile', 'Career Development'
+)
+
+# Topic groups are matched separately, so keywords overlapping across groups
+# ('Team Leadership' / 'Leadership') are all reported; keys are regex group names
+TOPIC_CATEGORIES = {f'topics_{index}': topic_list for index, topic_list in enumerate(TOPICS.values())}
+
+# Skill names containing any of these keywords are classed as soft skills
+SOFT_SKILL_CATEGORIES = {
+    'leadership': ('leadership', 'management', 'mentoring', 'coaching'),
+    'communication': ('communication', 'presentation', 'negotiation'),
+    'interpersonal': ('collaboration', 'teamwork', 'relationship'),
+    'business': ('strategy', 'business development', 'consulting'),
+    'project': ('project management', 'program management', 'agile')
+}
+
+# Keyword categories matched together by _scan_all
+KEYWORD_CATEGORIES = {
+    'cv_skills': CV_SKILLS,
+    'cv_roles': CV_ROLES,
+    'tech': TECHNICAL_SKILLS,
+    'soft': SOFT_SKILLS,
+    'roles': ROLES,
+    **TOPIC_CATEGORIES,
+    'expertise': EXPERTISE_AREAS,
+    'themes': POST_THEMES
+}
+
+# Texts shorter than the shortest keyword cannot contain a match
+MIN_KEYWORD_LENGTH = min(len(word) for words in KEYWORD_CATEGORIES.values() for word in words)
+
+# Lower-case keyword -> canonical spelling ('aws' -> 'AWS' rather than 'Aws')
+CANONICAL_KEYWORDS = {
+    word.lower(): word for words in KEYWORD_CATEGORIES.values() for word in words
+}
+
+
+def _trie_pattern(words):
+    """Render a list of words as a prefix-factored regex (e.g. A(?:I|WS|zure))"""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}  # End-of-word marker
+
+    def render(node):
+        alternatives = []
+        optional = False
+        for char in sorted(node):
+            if char == '':
+                optional = True
+                continue
+            alternatives.append(re.escape(char) + render(node[char]))
+        if not alternatives:
+            return ''
+        pattern = alternatives[0] if len(alternatives) == 1 else '(?:' + '|'.join(alternatives) + ')'
+        if optional:
+            # Greedy optional suffix so the longest keyword is tried first
+            pattern = f'(?:{pattern})?'
+        return pattern
+
+    return render(trie)
+
+
+def _compile_keywords(words):
+    """Compile a keyword list into a single whole-word pattern over case-folded text"""
+    return re.compile(r'\b(?:' + _trie_pattern([word.casefold() for word in words]) + r')\b')
+
+
+def _find_keywords(pattern, text, text_lc=None):
+    """Find a _compile_keywords pattern's keywords in text (or its precomputed casefold, text_lc)"""
+    if text_lc is None:
+        text_lc = text.casefold()
+    return [CANONICAL_KEYWORDS[keyword] for keyword in pattern.findall(text_lc)]
+
+
+TECH_SKILLS_RE = _compile_keywords(TECHNICAL_SKILLS)
+SOFT_SKILLS_RE = _compile_keywords(SOFT_SKILLS)
+ROLES_RE = _compile_keywords(ROLES)
+TOPICS_RES = tuple(_compile_keywords(topic_list) for topic_list in TOPIC_CATEGORIES.values())
+EXPERTISE_RE = _compile_keywords(EXPERTISE_AREAS)
+THEMES_RE = _compile_keywords(POST_THEMES)
+
+# At every word boundary where any keyword starts, one lookahead per category
+# captures that category's longest keyword, so overlapping keywords from
+# different categories ("Management" / "Project Management") are all reported.
+# Built from case-folded keywords and matched against case-folded text, so the
+# engine does plain literal matching instead of folding case on every character.
+MASTER_RE = re.compile(
+    r'\b(?=' + _trie_pattern({word.casefold() for word in CANONICAL_KEYWORDS.values()}) + r'\b)'
+    + ''.join(
+        f'(?:(?=(?P<{category}>{_trie_pattern([word.casefold() for word in words])})\\b))?'
+        for category, words in KEYWORD_CATEGORIES.items()
+    )
+)
+# Substring match over the case-folded skill, like the original `keyword in skill.lower()` checks
+SOFT_SKILL_RE = re.compile(
+    _trie_pattern([keyword for keywords in SOFT_SKILL_CATEGORIES.values() for keyword in keywords])
+)
+COMPANIES_RE = re.compile(r'(?:at|with)\s+([A-Z][A-Za-z\s]+(?:Inc\.|Ltd\.|LLC|Limited))')
+HASHTAG_RE = re.compile(r'#(\w+)')
+LIKES_RE = re.compile(r'(\d+)\s*(?:likes?|reactions?)', re.IGNORECASE)
+COMMENTS_RE = re.compile(r'(\d+)\s*comments?', re.IGNORECASE)
+SHARES_RE = re.compile(r'(\d+)\s*shares?', re.IGNORECASE)
+# LinkedIn experience PDF layout
+EXPERIENCE_SECTION_RE = re.compile(r'\n(?=[A-Z][^a-z]*(?:at|@)\s+[A-Z]|\d{4}\s*[-–]\s*(?:\d{4}|Present))')
+TITLE_COMPANY_RE = re.compile(r'(.*?)\s+(?:at|@)\s+(.*?)(?:\n|$)')
+DATE_RANGE_RE = re.compile(r'(\w{3}\s+\d{4})\s*[-–]\s*(\w{3}\s+\d{4}|Present)')
+LOCATION_RE = re.compile(r'\n([^·\n]*(?:Area|Region))[^\n]*')
+DURATION_YEARS_RE = re.compile(r'(\d+)\s*yr')
+DURATION_MONTHS_RE = re.compile(r'(\d+)\s*mo')
+# Blank-line separated paragraphs, and the markers that make one a key point
+PARAGRAPH_RE = re.compile(r'[^\n]+(?:\n[^\n]+)*')
+KEY_POINT_RE = re.compile(r'[•\-\d.]|key takeaway|learned|insight|conclusion', re.IGNORECASE)
+
+
+def _extract_pdf_text(path):
+    """Extract text from a PDF, preferring the native MuPDF and PDFium backends"""
+    # Pages are separated by a form feed, matching pdfminer's output
+    if fitz is not None:
+        try:
+            with fitz.open(path) as doc:
+                return '\f'.join(page.get_text('text') for page in doc)
+        except Exception as e:
+            logger.debug("PyMuPDF could not read %s, falling back: %s", path, e)
+    
+    if pdfium is not None:
+        try:
+            pdf = pdfium.PdfDocument(path)
+            try:
+                # PDFium emits CRLF line endings; normalise them for the line-based parsers
+                text = '\f'.join(page.get_textpage().get_text_range() for page in pdf)
+                return text.replace('\r\n', '\n')
+            finally:
+                pdf.close()
+        except Exception as e:
+            logger.debug("PDFium could not read %s, falling back: %s", path, e)
+    
+    return extract_text(path)
+
+
+def _scan_all(text, text_lc=None):
+    """Match every keyword category against the text (or its precomputed casefold, text_lc) in one pass"""
+    hits = {category: [] for category in KEYWORD_CATEGORIES}
+    # Empty PDF pages and blank posts are common; skip the regex for them
+    if len(text) >= MIN_KEYWORD_LENGTH and not text.isspace():
+        ends = dict.fromkeys(KEYWORD_CATEGORIES, 0)
+        if text_lc is None:
+            text_lc = text.casefold()
+        for match in MASTER_RE.finditer(text_lc):
+            start = match.start()
+            for category, keyword in match.groupdict().items():
+                # Skip hits inside this category's previous match, as findall would
+                if keyword is not None and start >= ends[category]:
+                    hits[category].append(CANONICAL_KEYWORDS[keyword])
+                    ends[category] = start + len(keyword)
+    
+    # Report the topic groups together, as the extractors expect
+    hits['topics'] = list(chain.from_iterable(hits.pop(category) for category in TOPIC_CATEGORIES))
+    return hits
+
+
+@lru_cache(maxsize=4096)
+def _is_soft_skill_name(skill):
+    """Whether a skill name contains a soft-skill keyword; memoized as skill names repeat across exports"""
+    return SOFT_SKILL_RE.search(skill.casefold()) is not None
+
+
+@lru_cache(maxsize=64)
+def _cached_pdf_text(path, mtime_ns, size):
+    """Memoized PDF extraction; the stat fields invalidate the entry when the file changes"""
+    return _extract_pdf_text(path)
+
+
+def _read_pdf_text(path):
+    """Extract PDF text, reusing the previous result if the file is unchanged"""
+    stat = os.stat(path)
+    return _cached_pdf_text(path, stat.st_mtime_ns, stat.st_size)
+
+
+_embedding_cache_lock = threading.Lock()
+
+# Per-thread record of whether the current parse_* call failed to embed any item
+_embedding_state = threading.local()
+
+
+def _embedding_key(text):
+    """Cache key for an embedding: the model plus a hash of the input text"""
+    return hashlib.sha1(f"{EMBEDDING_MODEL}\n{text}".encode('utf-8')).hexdigest()
+
+
+def _embed_texts(client, texts):
+    """Embed texts in batches, reusing vectors cached on disk from earlier runs"""
+    keys = [_embedding_key(text) for text in texts]
+    vectors = {}
+    # The disk cache is best-effort: an unusable cache directory must not stop embedding
+    if CACHE_DIR is not None:
+        try:
+            with _embedding_cache_lock:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                with shelve.open(str(CACHE_DIR / 'embeddings')) as cache:
+                    for key in keys:
+                        if key in cache:
+                            vectors[key] = cache[key]
+        except Exception as e:
+            logger.debug("Could not read the embedding cache in %s: %s", CACHE_DIR, e)
+    
+    # Only send unique uncached texts to the API
+    pending = list({key: text for key, text in zip(keys, texts) if key not in vectors}.items())
+    logger.debug("Embedding %d texts (%d cached)", len(pending), len(texts) - len(pending))
+    
+    def embed_batch(batch):
+        response = client.embeddings.create(
+            model=EMBEDDING_MODEL,
+            input=[text for _, text in batch]
+        )
+        return {key: data.embedding for (key, _), data in zip(batch, response.data)}
+    
+    # Send the batches concurrently; the requests are network-bound
+    batches = [pending[start:start + EMBEDDING_BATCH_SIZE] for start in range(0, len(pending), EMBEDDING_BATCH_SIZE)]
+    with ThreadPoolExecutor(max_workers=EMBEDDING_CONCURRENCY) as executor:
+        for fresh in executor.map(embed_batch, batches):
+            vectors.update(fresh)
+            if CACHE_DIR is None:
+                continue
+            try:
+                with _embedding_cache_lock, shelve.open(str(CACHE_DIR / 'embeddings')) as cache:
+                    cache.update(fresh)
+            except Exception as e:
+                logger.debug("Could not write the embedding cache in %s: %s", CACHE_DIR, e)
+    
+    return [vectors[key] for key in keys]
+
+
+def _utf8_prefix_ok(sample):
+    """Whether sample decodes as UTF-8, allowing a character cut off at the end of the sample"""
+    try:
+        sample.decode('utf-8')
+        return True
+    except UnicodeDecodeError as e:
+        return e.start >= len(sample) - 4 and e.reason == 'unexpected end of data'
+
+
+def _detect_encoding(sample):
+    """Pick a text encoding for the leading bytes of a file, or None if none fits"""
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+    # Prefer UTF-8 whenever the sample allows it: an ASCII-only sample says nothing
+    # about bytes past it, and UTF-8 is a superset of ASCII
+    if _utf8_prefix_ok(sample):
+        return 'utf-8'
+    if charset_normalizer is not None:
+        best = charset_normalizer.from_bytes(sample).best()
+        if best is not None:
+            return 'utf-8' if best.encoding == 'ascii' else best.encoding
+    for encoding in ('cp1252', 'latin1'):
+        try:
+            sample.decode(encoding)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return None
+
+
+def _sniff_encoding(path):
+    """Detect a file's text encoding from its first 64KB"""
+    with open(path, 'rb') as f:
+        sample = f.read(65536)
+    encoding = _detect_encoding(sample)
+    if encoding is None:
+        raise ValueError(f"Could not detect the encoding of file {path}")
+    return encoding
+
+
+def _iter_csv_columns(f, columns):
+    """Yield the stripped values of the named columns for each CSV row ('' when missing)"""
+    reader = csv.reader(f)
+    header = next(reader, [])
+    indices = [header.index(column) if column in header else None for column in columns]
+    for row in reader:
+        if not row:
+            continue  # Blank line, skipped like DictReader does
+        yield tuple(
+            row[i].strip() if i is not None and i < len(row) else ''
+            for i in indices
+        )
+
+
+def _parse_html_article(html):
+    """Extract title, body text and date from an article page (str or bytes)"""
+    if HTMLParser is not None:
+        tree = HTMLParser(html)
+        h1 = tree.css_first('h1')
+        time = tree.css_first('time')
+        body = tree.body
+        
+        return {
+            'title': h1.text(separator=' ', strip=True) if h1 else None,
+            'content': body.text(separator=' ', strip=True) if body else '',
+            'date': time.text(separator=' ', strip=True) if time else None
+        }
+    
+    soup = BeautifulSoup(html, BS4_PARSER)
+    h1 = soup.find('h1')
+    time = soup.find('time')
+    return {
+        'title': h1.text.strip() if h1 else None,
+        'content': soup.get_text(separator=' ', strip=True),
+        'date': time.text.strip() if time else None
+    }
+
+
+def _list_html_files(directory):
+    """List the .html files in a directory in one scandir pass (DirEntry caches the file type)"""
+    with os.scandir(directory) as entries:
+        return [entry.path for entry in entries if entry.name.endswith('.html') and entry.is_file()]
+
+
+def _parse_medium_html(path):
+    """Parse a single Medium HTML export into an article dict (run in worker threads)"""
+    try:
+        logger.debug("Processing %s", path)
+        # Both parsers take bytes and detect the charset from the document itself
+        article = _parse_html_article(Path(path).read_bytes())
+        logger.debug("Extracted article: %s", article['title'])
+        return article
+    except Exception as e:
+        logger.debug("Error processing file %s: %s", path, e)
+        return None
+
+
+def _file_signature(path):
+    """Identify a file (path, mtime, size) or directory (its entries' names, mtimes and sizes)"""
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    if not os.path.isdir(path):
+        return path, stat.st_mtime_ns, stat.st_size
+    with os.scandir(path) as entries:
+        listing = []
+        for entry in entries:
+            entry_stat = entry.stat()
+            listing.append((entry.name, entry_stat.st_mtime_ns, entry_stat.st_size))
+    return path, tuple(sorted(listing))
+
+
+def _cache_on_file(path_attr):
+    """Cache a parse_* method's result on disk until the input named by path_attr changes"""
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self):
+            if CACHE_DIR is None:
+                return method(self)
+            try:
+                key = (CACHE_VERSION, EMBEDDING_MODEL, method.__qualname__,
+                       _file_signature(getattr(self, path_attr)))
+            except (TypeError, OSError):
+                # Unset or missing input; let the method report it
+                return method(self)
+            
+            cache_file = CACHE_DIR / 'parsed' / f"{hashlib.sha1(repr(key).encode('utf-8')).hexdigest()}.pkl.gz"
+            if cache_file.exists():
+                try:
+                    with gzip.open(cache_file, 'rb') as f:
+                        return pickle.load(f)
+                except Exception as e:
+                    logger.debug("Ignoring unreadable cache file %s: %s", cache_file, e)
+            
+            outer_failed = getattr(_embedding_state, 'failed', False)
+            _embedding_state.failed = False
+            try:
+                result = method(self)
+                embeddings_failed = _embedding_state.failed
+            finally:
+                _embedding_state.failed = outer_failed or _embedding_state.failed
+            
+            # Don't persist results whose embeddings are missing; retry them next run
+            if result is not None and not embeddings_failed:
+                tmp_path = None
+                try:
+                    cache_file.parent.mkdir(parents=True, exist_ok=True)
+                    # Write to a temporary file first so concurrent readers never see a partial pickle
+                    with tempfile.NamedTemporaryFile(dir=cache_file.parent, suffix='.tmp', delete=False) as tmp:
+                        tmp_path = tmp.name
+                        with gzip.open(tmp, 'wb') as f:
+                            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    os.replace(tmp_path, cache_file)
+                except Exception as e:
+                    logger.debug("Could not cache %s result: %s", method.__qualname__, e)
+                    # Don't leave partial temporary files behind in the cache directory
+                    if tmp_path is not None:
+                        try:
+                            os.unlink(tmp_path)
+                        except OSError:
+                            pass
+            return result
+        return wrapper
+    return decorator
+
 
 class ProfileParser:
     def __init__(self, cv_path=None, cv_long_path=None, cv_more_path=None,
@@ -31,19 +554,22 @@ class ProfileParser:
         self.linkedin_endorsements_path = linkedin_endorsements_path
         self.linkedin_articles_path = linkedin_articles_path
         self.medium_path = medium_path
+        # Vectors embedded by this parser, keyed like the on-disk embedding cache
+        self._embedding_memo = {}
 
     def _normalize_list(self, items):
         """Normalize list items to remove duplicates and standardize case"""
-        # Convert all items to title case and remove duplicates
-        normalized = {item.title() for item in items if item}
-        return sorted(list(normalized))
+        # Known keywords keep their canonical spelling, anything else is title-cased
+        normalized = {CANONICAL_KEYWORDS.get(item.lower()) or item.title() for item in items if item}
+        return sorted(normalized)
 
+    @_cache_on_file('cv_path')
     def parse_cv(self):
         """Extract text from CV PDF and analyze for skills and experiences"""
         if not self.cv_path:
             return None
         
-        text = extract_text(self.cv_path)
+        text = _read_pdf_text(self.cv_path)
         analysis = self._analyze_text(text)
         
         return {
@@ -51,6 +577,7 @@ class ProfileParser:
             'experiences': self._normalize_list(analysis['experiences'])
         }
 
+    @_cache_on_file('skills_path')
     def parse_skills(self):
         """Extract and categorize skills from LinkedIn Skills CSV"""
         if not self.skills_path:
@@ -61,9 +588,7 @@ class ProfileParser:
             soft_skills = []
             
             with open(self.skills_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    skill_name = row.get('Name', '').strip()
+                for skill_name, in _iter_csv_columns(f, ('Name',)):
                     if skill_name:
                         if self._is_soft_skill(skill_name):
                             soft_skills.append(skill_name)
@@ -81,6 +606,7 @@ class ProfileParser:
             traceback.print_exc()
             return None
 
+    @_cache_on_file('linkedin_exp_path')
     def parse_linkedin_experience(self):
         """Parse LinkedIn experience from PDF or CSV"""
         if not self.linkedin_exp_path:
@@ -106,7 +632,7 @@ class ProfileParser:
             # Create embeddings for experience descriptions
             if len(experiences) > 0:
                 self._create_embeddings(experiences)
-                print(f"\nDebug: Created embeddings for {len(experiences)} experiences")
+                logger.debug("Created embeddings for %s experiences", len(experiences))
             
             # Extract additional metadata
             titles = [exp['title'] for exp in experiences if exp['title']]
@@ -128,146 +654,63 @@ class ProfileParser:
             traceback.print_exc()
             return None
 
+    @_cache_on_file('medium_path')
     def parse_medium_profile(self):
         """Extract information from Medium HTML files"""
         if not self.medium_path:
-            print("Debug: Medium path is not set")
+            logger.debug("Medium path is not set")
             return None
         
         try:
-            # Debug prints
-            print(f"Debug: Medium path is {self.medium_path}")
             medium_path = Path(self.medium_path)
-            print(f"Debug: Looking for HTML files in {medium_path}")
+            logger.debug("Looking for HTML files in %s", medium_path)
             
             # Check if directory exists
             if not medium_path.exists():
-                print(f"Debug: Directory does not exist: {medium_path}")
+                logger.debug("Directory does not exist: %s", medium_path)
                 return None
             
-            # List all HTML files found
-            html_files = list(medium_path.glob('*.html'))
-            print(f"Debug: Found {len(html_files)} HTML files")
-            for file in html_files:
-                print(f"Debug: Found file: {file}")
-            
-            articles = []
-            
-            # Process each HTML file
-            for html_file in html_files:
-                try:
-                    with open(html_file, 'r', encoding='utf-8') as f:
-                        print(f"Debug: Processing {html_file}")
-                        soup = BeautifulSoup(f.read(), 'html.parser')
-                        
-                        # Extract article data
-                        article = {
-                            'title': soup.find('h1').text.strip() if soup.find('h1') else None,
-                            'content': soup.get_text(separator=' ', strip=True),
-                            'date': soup.find('time').text.strip() if soup.find('time') else None
-                        }
-                        
-                        print(f"Debug: Extracted article: {article['title']}")
-                        articles.append(article)
-                except Exception as e:
-                    print(f"Debug: Error processing file {html_file}: {str(e)}")
-                    continue
+            # Parse the HTML files in parallel, dropping any that failed
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                parsed = executor.map(_parse_medium_html, _list_html_files(medium_path))
+                articles = [article for article in parsed if article is not None]
             
             if not articles:
-                print("Debug: No articles were successfully parsed")
+                logger.debug("No articles were successfully parsed")
                 return None
             
+            # Scan each article separately and merge the hits instead of joining the whole corpus
+            topics, expertise, themes = set(), set(), set()
+            for article in articles:
+                extracted = self.extract_all(article['content'])
+                topics.update(extracted['topics'])
+                expertise.update(extracted['expertise'])
+                themes.update(extracted['themes'])
+            
             return {
                 'articles': articles,
-                'topics': self._normalize_list(self._extract_topics(' '.join([a['content'] for a in articles]))),
-                'expertise': self._normalize_list(self._extract_expertise(' '.join([a['content'] for a in articles]))),
-                'content_themes': self._extract_post_themes(' '.join([a['content'] for a in articles])),
+                'topics': self._normalize_list(topics),
+                'expertise': self._normalize_list(expertise),
+                'content_themes': self._normalize_list(themes),
                 'article_count': len(articles)
             }
             
         except Exception as e:
             print(f"Error parsing Medium HTML files: {str(e)}")
-            print(f"Debug: Exception type: {type(e)}")
-            print(f"Debug: Exception traceback: {traceback.format_exc()}")
+            logger.debug("Medium parsing failed", exc_info=True)
             return None
 
-    def parse_linkedin_posts(self):
-        """Parse LinkedIn posts from CSV"""
-        print("\nDebug: Starting LinkedIn posts parsing...")
-        if not self.linkedin_posts_path or not os.path.exists(self.linkedin_posts_path):
-            print("Debug: LinkedIn posts path not provided or file doesn't exist")
-            return {'posts': [], 'topics': []}
-        
-        try:
-            import pandas as pd
-            posts = []
-            all_topics = set()
-            
-            print(f"Debug: Reading CSV from {self.linkedin_posts_path}")
-            df = pd.read_csv(self.linkedin_posts_path, encoding='utf-8')
-            
-            # Verify required columns
-            required_cols = ['Date', 'ShareCommentary']
-            if not all(col in df.columns for col in required_cols):
-                print(f"Error: Missing required columns. Found: {df.columns.tolist()}")
-                print(f"Required: {required_cols}")
-                return {'posts': [], 'topics': []}
-            
-            # Sort by date descending but process all posts
-            df['Date'] = pd.to_datetime(df['Date'])
-            df = df.sort_values('Date', ascending=False)
-            
-            print(f"Debug: Processing {len(df)} posts")
-            
-            for _, row in df.iterrows():
-                post_content = str(row['ShareCommentary']).strip()
-                if len(post_content) > 0:
-                    # Extract topics and themes
-                    post_topics = self._extract_topics(post_content)
-                    post_themes = self._extract_post_themes(post_content)
-                    
-                    # Store full post content but create a preview
-                    preview = post_content[:200] + '...' if len(post_content) > 200 else post_content
-                    
-                    posts.append({
-                        'date': row['Date'],
-                        'content': post_content,
-                        'preview': preview,
-                        'topics': post_topics,
-                        'themes': post_themes,
-                        'embedding': None  # Will be populated by create_embeddings
-                    })
-                    
-                    all_topics.update(post_topics)
-            
-            # Create embeddings for all posts
-            if len(posts) > 0:
-                self._create_embeddings(posts)
-            
-            # Summarize results
-            topic_freq = {}
-            for post in posts:
-                for topic in post['topics']:
-                    topic_freq[topic] = topic_freq.get(topic, 0) + 1
-            
-            print(f"\nDebug: LinkedIn Posts Analysis:")
-            print(f"- Total posts processed: {len(posts)}")
-            print(f"- Unique topics found: {len(all_topics)}")
-            print("- Top topics by frequency:")
-            for topic, freq in sorted(topic_freq.items(), key=lambda x: x[1], reverse=True)[:10]:
-                print(f"  * {topic}: {freq} mentions")
-            
-            return {
-                'posts': posts,
-                'topics': list(all_topics),
-                'topic_frequency': topic_freq,
-                'total_posts': len(posts)
+    def parse_all(self):
+        """Run the independent CV, skills, experience, posts and Medium parsers concurrently"""
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = {
+                'cv': executor.submit(self.parse_cv),
+                'skills': executor.submit(self.parse_skills),
+                'linkedin_experience': executor.submit(self.parse_linkedin_experience),
+                'linkedin_posts': executor.submit(self.parse_linkedin_posts),
+                'medium': executor.submit(self.parse_medium_profile)
             }
-            
-        except Exception as e:
-            print(f"Error parsing LinkedIn posts: {str(e)}")
-            traceback.print_exc()
-            return {'posts': [], 'topics': []}
+            return {name: future.result() for name, future in futures.items()}
 
     def parse_linkedin_data(self):
         """Parse all LinkedIn data sources"""
@@ -335,6 +778,7 @@ class ProfileParser:
         
         return linkedin_data
 
+    @_cache_on_file('linkedin_profile_path')
     def parse_linkedin_profile(self):
         """Parse LinkedIn profile data"""
         if not self.linkedin_profile_path:
@@ -356,6 +800,7 @@ class ProfileParser:
             traceback.print_exc()
             return None
 
+    @_cache_on_file('linkedin_articles_path')
     def parse_linkedin_articles(self):
         """Parse LinkedIn articles"""
         if not self.linkedin_articles_path:
@@ -366,17 +811,8 @@ class ProfileParser:
             articles_dir = Path(self.linkedin_articles_path)
             
             if articles_dir.is_dir():
-                for file in articles_dir.glob('*.html'):
-                    with open(file, 'r', encoding='utf-8') as f:
-                        soup = BeautifulSoup(f.read(), 'html.parser')
-                        title = soup.find('h1').text if soup.find('h1') else file.stem
-                        content = soup.get_text()
-                        articles.append({
-                            'title': title,
-                            'content': content,
-                            'topics': self._extract_topics(content),
-                            'expertise': self._extract_expertise(content)
-                        })
+                with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    articles = list(executor.map(self._parse_linkedin_article, _list_html_files(articles_dir)))
             
             return {'articles': articles}
             
@@ -385,6 +821,19 @@ class ProfileParser:
             traceback.print_exc()
             return None
 
+    def _parse_linkedin_article(self, path):
+        """Parse a single LinkedIn article HTML file (run in worker threads)"""
+        file = Path(path)
+        article = _parse_html_article(file.read_bytes())
+        extracted = self.extract_all(article['content'])
+        return {
+            'title': article['title'] or file.stem,
+            'content': article['content'],
+            'topics': extracted['topics'],
+            'expertise': extracted['expertise']
+        }
+
+    @_cache_on_file('linkedin_endorsements_path')
     def parse_linkedin_endorsements(self):
         """Parse LinkedIn endorsements"""
         if not self.linkedin_endorsements_path:
@@ -394,13 +843,10 @@ class ProfileParser:
             endorsements = {}
             
             try:
-                f, encoding = self._read_csv_with_encoding(self.linkedin_endorsements_path)
-                print(f"\nDebug: Successfully opened endorsements CSV with {encoding} encoding")
+                rows, encoding = self._read_csv_columns(self.linkedin_endorsements_path, ('Skill Name', 'Endorser'))
+                logger.debug("Successfully read endorsements CSV with %s encoding", encoding)
                 
-                reader = csv.DictReader(f)
-                for row in reader:
-                    skill = row.get('Skill Name', '').strip()
-                    endorser = row.get('Endorser', '').strip()
+                for skill, endorser in rows:
                     if skill:
                         if skill not in endorsements:
                             endorsements[skill] = {'count': 0, 'endorsers': set()}
@@ -408,8 +854,6 @@ class ProfileParser:
                         if endorser:
                             endorsements[skill]['endorsers'].add(endorser)
                 
-                f.close()
-                
             except Exception as e:
                 print(f"Error reading endorsements CSV: {str(e)}")
                 traceback.print_exc()
@@ -426,6 +870,7 @@ class ProfileParser:
             traceback.print_exc()
             return None
 
+    @_cache_on_file('linkedin_positions_path')
     def parse_linkedin_positions(self):
         """Parse LinkedIn positions from CSV"""
         if not self.linkedin_positions_path:
@@ -435,27 +880,27 @@ class ProfileParser:
             positions = []
             
             try:
-                f, encoding = self._read_csv_with_encoding(self.linkedin_positions_path)
-                print(f"\nDebug: Successfully opened positions CSV with {encoding} encoding")
+                columns = ('Title', 'Company Name', 'Location', 'Description', 'Started On',
+                           'Finished On', 'Duration', 'Employment Type', 'Company Industry')
+                rows, encoding = self._read_csv_columns(self.linkedin_positions_path, columns)
+                logger.debug("Successfully read positions CSV with %s encoding", encoding)
                 
-                reader = csv.DictReader(f)
-                for row in reader:
+                for title, company, location, description, started_on, finished_on, \
+                        duration, employment_type, industry in rows:
                     position = {
-                        'title': row.get('Title', '').strip(),
-                        'company': row.get('Company Name', '').strip(),
-                        'location': row.get('Location', '').strip(),
-                        'description': row.get('Description', '').strip(),
-                        'started_on': row.get('Started On', '').strip(),
-                        'finished_on': row.get('Finished On', '').strip(),
-                        'duration': row.get('Duration', '').strip(),
-                        'employment_type': row.get('Employment Type', '').strip(),
-                        'industry': row.get('Company Industry', '').strip(),
+                        'title': title,
+                        'company': company,
+                        'location': location,
+                        'description': description,
+                        'started_on': started_on,
+                        'finished_on': finished_on,
+                        'duration': duration,
+                        'employment_type': employment_type,
+                        'industry': industry,
                         'embedding': None  # Will be populated by create_embeddings
                     }
                     positions.append(position)
-                    print(f"\nDebug: Parsed position: {position['title']} at {position['company']}")
-                
-                f.close()
+                    logger.debug("Parsed position: %s at %s", position['title'], position['company'])
                 
             except Exception as e:
                 print(f"Error reading positions CSV: {str(e)}")
@@ -472,22 +917,59 @@ class ProfileParser:
             traceback.print_exc()
             return None
 
-    def _read_csv_with_encoding(self, file_path):
-        """Try different encodings to read CSV file"""
-        encodings = ['utf-8', 'utf-16', 'latin1', 'cp1252']
-        
-        for encoding in encodings:
+    def _read_csv_with_encoding(self, file_path, errors='strict'):
+        """Open a CSV file with its detected encoding; use the returned file as a context manager"""
+        encoding = _sniff_encoding(file_path)
+        return open(file_path, 'r', encoding=encoding, errors=errors, newline=''), encoding
+
+    def _read_csv_columns(self, file_path, columns):
+        """Read the named CSV columns as rows of stripped strings ('' when missing), with the encoding used"""
+        if pacsv is not None:
+            encoding = _sniff_encoding(file_path)
             try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    # Try to read first line to verify encoding
-                    f.readline()
-                    # If successful, rewind and return file object
-                    f.seek(0)
-                    return f, encoding
-            except UnicodeDecodeError:
-                continue
+                table = pacsv.read_csv(
+                    file_path,
+                    read_options=pacsv.ReadOptions(encoding=encoding, block_size=1 << 20),
+                    # Description fields in LinkedIn exports contain quoted newlines
+                    parse_options=pacsv.ParseOptions(newlines_in_values=True),
+                    convert_options=pacsv.ConvertOptions(
+                        column_types={column: pa.string() for column in columns},
+                        include_columns=list(columns),
+                        include_missing_columns=True
+                    )
+                )
+                values = ([value.strip() if value else '' for value in table[column].to_pylist()]
+                          for column in columns)
+                return list(zip(*values)), encoding
+            except (pa.ArrowInvalid, UnicodeDecodeError) as e:
+                # Ragged rows, or bytes that don't fit the encoding; the csv module is more forgiving
+                logger.debug("pyarrow could not parse %s, falling back to csv: %s", file_path, e)
         
-        raise ValueError(f"Could not read file {file_path} with any of the attempted encodings: {encodings}")
+        try:
+            f, encoding = self._read_csv_with_encoding(file_path)
+            with f:
+                return list(_iter_csv_columns(f, columns)), encoding
+        except UnicodeDecodeError as e:
+            # Bytes past the sniffed sample don't fit its encoding; keep the rest of the export
+            logger.debug("%s is not valid %s, reading with replacement characters: %s", file_path, encoding, e)
+        
+        f, encoding = self._read_csv_with_encoding(file_path, errors='replace')
+        with f:
+            return list(_iter_csv_columns(f, columns)), encoding
+
+    def _read_csv_records(self, file_path, fields):
+        """Read a CSV export into dicts keyed by fields[column], with stripped values ('' when missing)"""
+        encoding = _sniff_encoding(file_path)
+        options = dict(encoding=encoding, dtype=str, keep_default_na=False,
+                       usecols=lambda column: column in fields)
+        try:
+            df = pd.read_csv(file_path, **options)
+        except UnicodeDecodeError as e:
+            # Bytes past the sniffed sample don't fit its encoding; keep the rest of the export
+            logger.debug("%s is not valid %s, reading with replacement characters: %s", file_path, encoding, e)
+            df = pd.read_csv(file_path, encoding_errors='replace', **options)
+        df = df.reindex(columns=list(fields), fill_value='').apply(lambda column: column.str.strip())
+        return df.rename(columns=fields).to_dict('records'), encoding
 
     def _parse_linkedin_experience_csv(self):
         """Parse LinkedIn experience from CSV format"""
@@ -495,25 +977,25 @@ class ProfileParser:
             experiences = []
             
             try:
-                f, encoding = self._read_csv_with_encoding(self.linkedin_exp_path)
-                print(f"\nDebug: Successfully opened experience CSV with {encoding} encoding")
+                columns = ('Title', 'Company Name', 'Location', 'Description',
+                           'Started On', 'Finished On', 'Duration')
+                rows, encoding = self._read_csv_columns(self.linkedin_exp_path, columns)
+                logger.debug("Successfully read experience CSV with %s encoding", encoding)
                 
-                reader = csv.DictReader(f)
-                for row in reader:
+                for title, company, location, description, started_on, finished_on, \
+                        duration in rows:
                     experience = {
-                        'title': row.get('Title', '').strip(),
-                        'company': row.get('Company Name', '').strip(),
-                        'location': row.get('Location', '').strip(),
-                        'description': row.get('Description', '').strip(),
-                        'started_on': row.get('Started On', '').strip(),
-                        'finished_on': row.get('Finished On', '').strip(),
-                        'duration': row.get('Duration', '').strip(),
+                        'title': title,
+                        'company': company,
+                        'location': location,
+                        'description': description,
+                        'started_on': started_on,
+                        'finished_on': finished_on,
+                        'duration': duration,
                         'embedding': None
                     }
                     experiences.append(experience)
-                    print(f"Debug: Parsed experience: {experience['title']} at {experience['company']}")
-                
-                f.close()
+                    logger.debug("Parsed experience: %s at %s", experience['title'], experience['company'])
                 
             except Exception as e:
                 print(f"Error reading experience CSV: {str(e)}")
@@ -530,71 +1012,71 @@ class ProfileParser:
     def _parse_linkedin_experience_pdf(self):
         """Parse LinkedIn experience from PDF format"""
         try:
-            import PyPDF2
-            import re
-            
             experiences = []
             current_experience = {}
             
-            with open(self.linkedin_exp_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
+            # Extract text from all pages
+            text = _read_pdf_text(self.linkedin_exp_path)
+            
+            # Split into experience sections
+            # Look for patterns like "Title at Company" or "Company Name"
+            experience_sections = EXPERIENCE_SECTION_RE.split(text)
+            
+            for section in experience_sections:
+                if not section.strip():
+                    continue
+                    
+                exp = {}
                 
-                # Extract text from all pages
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text()
+                # Extract title and company
+                title_company_match = TITLE_COMPANY_RE.search(section)
+                if title_company_match:
+                    exp['title'] = title_company_match.group(1).strip()
+                    exp['company'] = title_company_match.group(2).strip()
+                else:
+                    # Try alternative patterns
+                    lines = section.split('\n')
+                    exp['title'] = lines[0].strip() if lines else ''
+                    exp['company'] = lines[1].strip() if len(lines) > 1 else ''
                 
-                # Split into experience sections
-                # Look for patterns like "Title at Company" or "Company Name"
-                experience_sections = re.split(r'\n(?=[A-Z][^a-z]*(?:at|@)\s+[A-Z]|\d{4}\s*[-–]\s*(?:\d{4}|Present))', text)
+                # Extract dates
+                date_match = DATE_RANGE_RE.search(section)
+                if date_match:
+                    exp['started_on'] = date_match.group(1)
+                    exp['finished_on'] = date_match.group(2)
                 
-                for section in experience_sections:
-                    if not section.strip():
-                        continue
-                        
-                    exp = {}
-                    
-                    # Extract title and company
-                    title_company_match = re.search(r'(.*?)\s+(?:at|@)\s+(.*?)(?:\n|$)', section)
-                    if title_company_match:
-                        exp['title'] = title_company_match.group(1).strip()
-                        exp['company'] = title_company_match.group(2).strip()
-                    else:
-                        # Try alternative patterns
-                        lines = section.split('\n')
-                        exp['title'] = lines[0].strip() if lines else ''
-                        exp['company'] = lines[1].strip() if len(lines) > 1 else ''
-                    
-                    # Extract dates
-                    date_match = re.search(r'(\w{3}\s+\d{4})\s*[-–]\s*(\w{3}\s+\d{4}|Present)', section)
-                    if date_match:
-                        exp['started_on'] = date_match.group(1)
-                        exp['finished_on'] = date_match.group(2)
-                    
-                    # Extract location
-                    location_match = re.search(r'\n([^·\n]*(?:Area|Region))[^\n]*', section)
-                    if location_match:
-                        exp['location'] = location_match.group(1).strip()
-                    else:
-                        exp['location'] = ''
-                    
-                    # Extract description
-                    # Get text after the header information
-                    desc_text = re.split(r'\n\n', section, maxsplit=1)
-                    if len(desc_text) > 1:
-                        exp['description'] = desc_text[1].strip()
-                    else:
-                        exp['description'] = ''
-                    
-                    # Calculate duration
-                    exp['duration'] = self._calculate_duration(exp.get('started_on', ''), exp.get('finished_on', ''))
-                    
-                    # Initialize embedding field
-                    exp['embedding'] = None
-                    
-                    if exp['title'] and exp['company']:  # Only add if we have basic info
-                        experiences.append(exp)
-                        print(f"\nDebug: Parsed experience: {exp['title']} at {exp['company']}")
+                # Extract location
+                location_match = LOCATION_RE.search(section)
+                if location_match:
+                    exp['location'] = location_match.group(1).strip()
+                else:
+                    exp['location'] = ''
+                
+                # Extract description
+                # Get text after the header information
+                desc_text = section.split('\n\n', 1)
+                if len(desc_text) > 1:
+                    exp['description'] = desc_text[1].strip()
+                else:
+                    exp['description'] = ''
+                
+                # Duration is calculated for all sections at once below
+                exp['duration'] = ''
+                
+                # Initialize embedding field
+                exp['embedding'] = None
+                
+                if exp['title'] and exp['company']:  # Only add if we have basic info
+                    experiences.append(exp)
+                    logger.debug("Parsed experience: %s at %s", exp['title'], exp['company'])
+            
+            # Calculate durations
+            durations = self._calculate_durations(
+                [exp.get('started_on', '') for exp in experiences],
+                [exp.get('finished_on', '') for exp in experiences]
+            )
+            for exp, duration in zip(experiences, durations):
+                exp['duration'] = duration
             
             return experiences
             
@@ -603,23 +1085,22 @@ class ProfileParser:
             traceback.print_exc()
             return []
 
+    @_cache_on_file('linkedin_posts_path')
     def parse_linkedin_posts(self):
         """Parse LinkedIn posts from CSV"""
-        print("\nDebug: Starting LinkedIn posts parsing...")
+        logger.debug("Starting LinkedIn posts parsing...")
         if not self.linkedin_posts_path or not os.path.exists(self.linkedin_posts_path):
-            print("Debug: LinkedIn posts path not provided or file doesn't exist")
+            logger.debug("LinkedIn posts path not provided or file doesn't exist")
             return {'posts': [], 'topics': []}
         
         try:
             import pandas as pd
-            posts = []
-            all_topics = set()
             
-            print(f"Debug: Reading CSV from {self.linkedin_posts_path}")
+            logger.debug("Reading CSV from %s", self.linkedin_posts_path)
             try:
                 f, encoding = self._read_csv_with_encoding(self.linkedin_posts_path)
-                df = pd.read_csv(f, encoding=encoding)
-                f.close()
+                with f:
+                    df = pd.read_csv(f, encoding=encoding)
             except Exception as e:
                 print(f"Error reading posts CSV: {str(e)}")
                 return {'posts': [], 'topics': []}
@@ -635,58 +1116,55 @@ class ProfileParser:
             df['Date'] = pd.to_datetime(df['Date'])
             df = df.sort_values('Date', ascending=False)
             
-            print(f"Debug: Processing {len(df)} total posts")
+            logger.debug("Processing %s total posts", len(df))
+            
+            # Clean the post text and drop empty posts column-wise
+            content = df['ShareCommentary'].fillna('').astype(str).str.strip()
+            keep = content.str.len() > 0
+            dates, content = df['Date'][keep], content[keep]
+            
+            # Store full post content but create a preview
+            previews = content.str.slice(0, 200)
+            previews = previews.where(content.str.len() <= 200, previews + '...')
             
             # Process all posts but only create embeddings for top 20
-            for idx, row in df.iterrows():
-                post_content = str(row['ShareCommentary']).strip()
-                if len(post_content) > 0:
-                    # Extract topics and themes
-                    post_topics = self._extract_topics(post_content)
-                    post_themes = self._extract_post_themes(post_content)
-                    
-                    # Store full post content but create a preview
-                    preview = post_content[:200] + '...' if len(post_content) > 200 else post_content
-                    
-                    post = {
-                        'date': row['Date'],
-                        'content': post_content,
-                        'preview': preview,
-                        'topics': post_topics,
-                        'themes': post_themes,
-                        'embedding': None  # Will be populated for top 20 only
-                    }
-                    
-                    posts.append(post)
-                    all_topics.update(post_topics)
+            posts = []
+            for date, post_content, preview in zip(dates, content, previews):
+                # Extract topics and themes
+                extracted = self.extract_all(post_content)
+                posts.append({
+                    'date': date,
+                    'content': post_content,
+                    'preview': preview,
+                    'topics': extracted['topics'],
+                    'themes': extracted['themes'],
+                    'embedding': None  # Will be populated for top 20 only
+                })
             
             # Create embeddings only for top 20 recent posts
             if len(posts) > 0:
                 top_20_posts = posts[:20]
                 self._create_embeddings(top_20_posts)
-                print(f"\nDebug: Created embeddings for top {len(top_20_posts)} recent posts")
+                logger.debug("Created embeddings for top %s recent posts", len(top_20_posts))
                 
                 # Update the posts list with the embedded top 20
                 posts[:20] = top_20_posts
         
             # Summarize results
-            topic_freq = {}
-            for post in posts:
-                for topic in post['topics']:
-                    topic_freq[topic] = topic_freq.get(topic, 0) + 1
+            topic_freq = Counter(chain.from_iterable(post['topics'] for post in posts))
         
-            print(f"\nDebug: LinkedIn Posts Analysis:")
-            print(f"- Total posts processed: {len(posts)}")
-            print(f"- Posts with embeddings: {len([p for p in posts if p.get('embedding')])}")
-            print(f"- Unique topics found: {len(all_topics)}")
-            print("- Top topics by frequency:")
-            for topic, freq in sorted(topic_freq.items(), key=lambda x: x[1], reverse=True)[:10]:
-                print(f"  * {topic}: {freq} mentions")
+            logger.debug("LinkedIn Posts Analysis:")
+            logger.debug("- Total posts processed: %s", len(posts))
+            logger.debug("- Posts with embeddings: %s", len([p for p in posts if p.get('embedding')]))
+            logger.debug("- Unique topics found: %s", len(topic_freq))
+            logger.debug("- Top topics by frequency:")
+            for topic, freq in topic_freq.most_common(10):
+                logger.debug("  * %s: %s mentions", topic, freq)
         
             return {
                 'posts': posts,
-                'topics': list(all_topics),
-                'topic_frequency': topic_freq,
+                'topics': list(topic_freq),
+                'topic_frequency': dict(topic_freq),
                 'total_posts': len(posts)
             }
             
@@ -695,200 +1173,113 @@ class ProfileParser:
             traceback.print_exc()
             return {'posts': [], 'topics': []}
 
+    def extract_all(self, text):
+        """Extract skills, roles, expertise, themes and topics from text in a single keyword scan"""
+        # Case-fold once; the scan and every extractor share it
+        text_lc = text.casefold()
+        scan = _scan_all(text, text_lc)
+        return {
+            'skills': scan['tech'],
+            'soft_skills': scan['soft'],
+            'roles': scan['roles'],
+            'expertise': self._extract_expertise(text, scan, text_lc),
+            'themes': self._extract_post_themes(text, scan, text_lc),
+            'topics': self._extract_topics(text, scan, text_lc)
+        }
+
     def _analyze_text(self, text):
         """Analyze text to extract skills and experiences"""
-        technical_skills = [
-            'Python', 'Java', 'AWS', 'Azure', 'Cloud', 'AI', 'ML', 
-            'DevOps', 'Agile', 'Project Management'
-        ]
-        
-        roles = [
-            'Program Manager', 'Director', 'Engineer', 'Head', 'Lead',
-            'Architect', 'CTO', 'Technical Program Manager'
-        ]
-        
-        skills_pattern = '|'.join(technical_skills)
-        roles_pattern = '|'.join(roles)
-        
-        skills = re.findall(f'\\b({skills_pattern})\\b', text, re.IGNORECASE)
-        experiences = re.findall(f'\\b({roles_pattern})\\b', text, re.IGNORECASE)
-        
+        scan = _scan_all(text)
         return {
-            'skills': skills,
-            'experiences': experiences
+            'skills': scan['cv_skills'],
+            'experiences': scan['cv_roles']
         }
 
-    def _extract_technical_skills(self, text):
+    def _extract_technical_skills(self, text, text_lc=None):
         """Extract technical skills from text"""
-        skills = [
-            'Python', 'Java', 'AWS', 'Azure', 'Cloud', 'AI', 'ML',
-            'DevOps', 'Agile', 'Kubernetes', 'Docker', 'Microservices'
-        ]
-        pattern = '|'.join(skills)
-        return re.findall(f'\\b({pattern})\\b', text, re.IGNORECASE)
-
-    def _extract_soft_skills(self, text):
+        return _find_keywords(TECH_SKILLS_RE, text, text_lc)
+
+    def _extract_soft_skills(self, text, text_lc=None):
         """Extract soft skills from text"""
-        skills = [
-            'Leadership', 'Management', 'Communication', 'Strategy',
-            'Vision', 'Innovation', 'Problem Solving', 'Team Building'
-        ]
-        pattern = '|'.join(skills)
-        return re.findall(f'\\b({pattern})\\b', text, re.IGNORECASE)
-
-    def _extract_roles(self, text):
+        return _find_keywords(SOFT_SKILLS_RE, text, text_lc)
+
+    def _extract_roles(self, text, text_lc=None):
         """Extract roles from text"""
-        roles = [
-            'Director', 'Manager', 'Lead', 'Head', 'Architect',
-            'CTO', 'Technical Program Manager', 'Program Director'
-        ]
-        pattern = '|'.join(roles)
-        return re.findall(f'\\b({pattern})\\b', text, re.IGNORECASE)
+        return _find_keywords(ROLES_RE, text, text_lc)
 
     def _extract_companies(self, text):
         """Extract company names from text"""
-        companies = re.findall(r'(?:at|with)\s+([A-Z][A-Za-z\s]+(?:Inc\.|Ltd\.|LLC|Limited))', 
-                             text)
+        companies = COMPANIES_RE.findall(text)
         return list(set(companies))
 
-    def _extract_topics(self, text):
+    def _extract_topics(self, text, scan=None, text_lc=None):
         """Extract topics from text using NLP and pattern matching"""
-        # Common tech and business topics
-        topics = {
-            'AI/ML': [
-                'AI', 'ML', 'Machine Learning', 'Artificial Intelligence', 'Deep Learning',
-                'Neural Networks', 'NLP', 'Computer Vision', 'Data Science',
-                'Generative AI', 'LLM', 'Large Language Models'
-            ],
-            'Cloud/Infrastructure': [
-                'Cloud', 'AWS', 'Azure', 'GCP', 'Kubernetes', 'Docker',
-                'Microservices', 'DevOps', 'Infrastructure'
-            ],
-            'Business/Strategy': [
-                'Leadership', 'Strategy', 'Innovation', 'Digital Transformation',
-                'Product Management', 'Agile', 'Business Development'
-            ],
-            'Industry': [
-                'Healthcare', 'Finance', 'Automotive', 'Retail', 'Manufacturing',
-                'Technology', 'Consulting'
-            ],
-            'Skills': [
-                'Project Management', 'Program Management', 'Team Leadership',
-                'Architecture', 'Security', 'Data Analytics'
-            ]
-        }
+        if scan is None:
+            if text_lc is None:
+                text_lc = text.casefold()
+            scan = {'topics': [topic for pattern in TOPICS_RES for topic in _find_keywords(pattern, text, text_lc)]}
+        found_topics = {topic.lower() for topic in scan['topics']}
         
-        found_topics = set()
-        text = text.lower()
-        
-        # Extract topics by category
-        for category, topic_list in topics.items():
-            pattern = '|'.join(map(re.escape, topic_list))
-            matches = re.findall(f'\\b({pattern})\\b', text, re.IGNORECASE)
-            found_topics.update(matches)
-        
-        # Extract hashtags
-        hashtags = re.findall(r'#(\w+)', text)
-        found_topics.update(hashtags)
+        # Extract hashtags; most texts have none, so skip the regex with a substring check
+        if '#' in text:
+            found_topics.update(tag.lower() for tag in HASHTAG_RE.findall(text))
         
         return list(found_topics)
 
-    def _extract_expertise(self, text):
+    def _extract_expertise(self, text, scan=None, text_lc=None):
         """Extract areas of expertise"""
-        areas = [
-            'Technology', 'Strategy', 'Architecture', 'Management',
-            'Digital Transformation', 'Innovation', 'Leadership'
-        ]
-        pattern = '|'.join(areas)
-        return re.findall(f'\\b({pattern})\\b', text, re.IGNORECASE)
-
-    def _extract_post_themes(self, text):
+        if scan is not None:
+            return scan['expertise']
+        return _find_keywords(EXPERTISE_RE, text, text_lc)
+
+    def _extract_post_themes(self, text, scan=None, text_lc=None):
         """Extract main themes from posts"""
-        themes = [
-            'Digital Transformation', 'Cloud Computing', 'Leadership',
-            'Technology Strategy', 'Innovation', 'AI/ML',
-            'Project Management', 'Agile', 'Career Development'
-        ]
-        found_themes = []
-        for theme in themes:
-            if re.search(rf'\b{theme}\b', text, re.IGNORECASE):
-                found_themes.append(theme)
-        return self._normalize_list(found_themes)
+        if scan is None:
+            scan = {'themes': _find_keywords(THEMES_RE, text, text_lc)}
+        return self._normalize_list(scan['themes'])
 
     def _extract_engagement_metrics(self, text):
         """Extract engagement metrics from posts"""
         metrics = {
-            'likes': self._extract_numbers(r'(\d+)\s*(?:likes?|reactions?)', text),
-            'comments': self._extract_numbers(r'(\d+)\s*comments?', text),
-            'shares': self._extract_numbers(r'(\d+)\s*shares?', text)
+            'likes': self._extract_numbers(LIKES_RE, text),
+            'comments': self._extract_numbers(COMMENTS_RE, text),
+            'shares': self._extract_numbers(SHARES_RE, text)
         }
         return metrics
 
     def _extract_numbers(self, pattern, text):
-        """Extract numbers using regex pattern"""
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        return [int(num) for num in matches if num.isdigit()]
+        """Extract numbers using a compiled regex pattern with one digit group"""
+        return list(map(int, pattern.findall(text)))
 
     def _summarize_post_content(self, text):
         """Extract key points from post content"""
-        # Split text into paragraphs
-        paragraphs = text.split('\n\n')
-        
-        # Look for key content indicators
-        key_points = []
-        for para in paragraphs:
-            # Look for bullet points or numbered lists
-            if re.search(r'[•\-\d+\.]', para):
-                key_points.append(para.strip())
-            # Look for paragraphs with key phrases
-            elif any(phrase in para.lower() for phrase in ['key takeaway', 'learned', 'insight', 'conclusion']):
-                key_points.append(para.strip())
-            
-        return key_points[:5]  # Return top 5 key points
+        # Look for bullet points, numbered lists or key phrases, paragraph by paragraph
+        key_points = (
+            match.group().strip()
+            for match in PARAGRAPH_RE.finditer(text)
+            if KEY_POINT_RE.search(match.group())
+        )
+        return list(islice(key_points, 5))  # Return top 5 key points
 
     def _is_soft_skill(self, skill: str) -> bool:
         """Determine if a skill is a soft skill"""
-        soft_skill_categories = {
-            'leadership': ['leadership', 'management', 'mentoring', 'coaching'],
-            'communication': ['communication', 'presentation', 'negotiation'],
-            'interpersonal': ['collaboration', 'teamwork', 'relationship'],
-            'business': ['strategy', 'business development', 'consulting'],
-            'project': ['project management', 'program management', 'agile']
-        }
-
-        skill_lower = skill.lower()
-        return any(
-            any(keyword in skill_lower for keyword in keywords)
-            for keywords in soft_skill_categories.values()
-        )
+        return _is_soft_skill_name(skill)
 
+    @_cache_on_file('linkedin_certifications_path')
     def parse_linkedin_certifications(self):
         """Parse LinkedIn certifications from CSV"""
         if not self.linkedin_certifications_path:
             return None
         
         try:
-            certifications = []
-            
             try:
-                f, encoding = self._read_csv_with_encoding(self.linkedin_certifications_path)
-                print(f"\nDebug: Successfully opened certifications CSV with {encoding} encoding")
-                
-                reader = csv.DictReader(f)
-                for row in reader:
-                    cert = {
-                        'name': row.get('Name', '').strip(),
-                        'authority': row.get('Authority', '').strip(),
-                        'license_number': row.get('License Number', '').strip(),
-                        'time_period': row.get('Time Period', '').strip(),
-                        'url': row.get('URL', '').strip()
-                    }
-                    
-                    if cert['name']:  # Only add if we have a name
-                        certifications.append(cert)
-                        print(f"Debug: Parsed certification: {cert['name']} from {cert['authority']}")
+                fields = {'Name': 'name', 'Authority': 'authority', 'License Number': 'license_number',
+                          'Time Period': 'time_period', 'URL': 'url'}
+                records, encoding = self._read_csv_records(self.linkedin_certifications_path, fields)
+                logger.debug("Successfully read certifications CSV with %s encoding", encoding)
                 
-                f.close()
+                # Only keep certifications that have a name
+                certifications = [cert for cert in records if cert['name']]
                 
             except Exception as e:
                 print(f"Error reading certifications CSV: {str(e)}")
@@ -905,23 +1296,16 @@ class ProfileParser:
             traceback.print_exc()
             return None
 
+    @_cache_on_file('linkedin_education_path')
     def parse_linkedin_education(self):
         """Parse LinkedIn education"""
         if not self.linkedin_education_path:
             return None
         
         try:
-            education = []
-            with open(self.linkedin_education_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    education.append({
-                        'degree': row.get('Degree Name', '').strip(),
-                        'school': row.get('School Name', '').strip(),
-                        'field': row.get('Notes', '').strip()
-                    })
-                    print(f"Degree: {row.get('Degree Name', '').strip()}")
-                    print(f"School: {row.get('School Name', '').strip()}")
+            fields = {'Degree Name': 'degree', 'School Name': 'school', 'Notes': 'field'}
+            education, encoding = self._read_csv_records(self.linkedin_education_path, fields)
+            logger.debug("Parsed %s education entries", len(education))
             return education
             
         except Exception as e:
@@ -932,9 +1316,7 @@ class ProfileParser:
     def _create_embeddings(self, items):
         """Create embeddings for a list of items with content"""
         try:
-            from openai import OpenAI
-            client = OpenAI()
-            
+            texts = []
             for item in items:
                 if 'content' in item:
                     text = item['content']
@@ -948,72 +1330,73 @@ class ProfileParser:
                     if item.get('industry'):
                         text += f"Industry: {item.get('industry')}\n"
                     text += f"Description: {item.get('description', '')}"
-            
+                texts.append(text[:8000])  # Limit to max tokens
+            
+            # Items already embedded by this parser (e.g. experiences re-combined in
+            # parse_linkedin_data) skip the client and the disk cache entirely
+            keys = [_embedding_key(text) for text in texts]
+            missing = {key: text for key, text in zip(keys, texts) if key not in self._embedding_memo}
+            if missing:
+                from openai import OpenAI
+                client = OpenAI()
+                
                 try:
-                    response = client.embeddings.create(
-                        model="text-embedding-ada-002",
-                        input=text[:8000]  # Limit to max tokens
-                    )
-                    item['embedding'] = response.data[0].embedding
-                    print(f"Created embedding for: {item.get('title', 'content item')}")
+                    self._embedding_memo.update(zip(missing, _embed_texts(client, list(missing.values()))))
                 except Exception as e:
-                    print(f"Error creating embedding: {str(e)}")
-                    item['embedding'] = None
+                    print(f"Error creating embeddings: {str(e)}")
+            
+            embeddings = [self._embedding_memo.get(key) for key in keys]
+            for item, embedding in zip(items, embeddings):
+                item['embedding'] = embedding
+            print(f"Created embeddings for {sum(e is not None for e in embeddings)} items")
+            if any(embedding is None for embedding in embeddings):
+                _embedding_state.failed = True
                 
         except Exception as e:
             print(f"Error initializing embeddings: {str(e)}")
+            _embedding_state.failed = True
 
     def _calculate_duration(self, start_date, end_date):
         """Calculate duration between two dates"""
-        try:
-            from datetime import datetime
-            
-            # Parse start date
-            start = datetime.strptime(start_date, '%b %Y')
-            
-            # Parse end date
-            if end_date.lower() == 'present':
-                end = datetime.now()
-            else:
-                end = datetime.strptime(end_date, '%b %Y')
-            
-            # Calculate difference in years and months
-            years = end.year - start.year
-            months = end.month - start.month
-            
-            if months < 0:
-                years -= 1
-                months += 12
+        return self._calculate_durations([start_date], [end_date])[0]
+
+    def _calculate_durations(self, start_dates, end_dates):
+        """Calculate durations for paired 'Mon YYYY' start/end dates in one vectorized pass"""
+        starts = pd.to_datetime(pd.Series(start_dates, dtype=object), format='%b %Y', errors='coerce')
+        end_dates = pd.Series(end_dates, dtype=object).fillna('').astype(str)
+        ends = pd.to_datetime(end_dates, format='%b %Y', errors='coerce')
+        ends = ends.mask(end_dates.str.lower() == 'present', pd.Timestamp.now())
+        
+        # Difference in whole months; unparseable dates give an empty duration
+        total_months = (ends.dt.year - starts.dt.year) * 12 + (ends.dt.month - starts.dt.month)
+        
+        durations = []
+        for months in total_months:
+            if pd.isna(months):
+                durations.append("")
+                continue
             
             # Format duration string
+            years, months = divmod(int(months), 12)
             if years > 0 and months > 0:
-                return f"{years} yr {months} mo"
+                durations.append(f"{years} yr {months} mo")
             elif years > 0:
-                return f"{years} yr"
+                durations.append(f"{years} yr")
             else:
-                return f"{months} mo"
-                
-        except Exception as e:
-            print(f"Error calculating duration: {str(e)}")
-            return ""
+                durations.append(f"{months} mo")
+        return durations
 
     def _calculate_total_experience(self, experiences):
         """Calculate total experience duration"""
         total_months = 0
         
-        for exp in experiences:
-            duration = exp.get('duration', '')
-            if not duration:
-                continue
-                
-            # Extract years and months
-            years = re.search(r'(\d+)\s*yr', duration)
-            months = re.search(r'(\d+)\s*mo', duration)
+        if experiences:
+            durations = pd.Series([exp.get('duration') or '' for exp in experiences], dtype=str)
             
-            if years:
-                total_months += int(years.group(1)) * 12
-            if months:
-                total_months += int(months.group(1))
+            # Extract years and months
+            years = pd.to_numeric(durations.str.extract(DURATION_YEARS_RE, expand=False))
+            months = pd.to_numeric(durations.str.extract(DURATION_MONTHS_RE, expand=False))
+            total_months = int(years.sum()) * 12 + int(months.sum())
         
         # Convert back to years and months
         years = total_months // 12